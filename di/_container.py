@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import threading
 import typing
 from contextlib import AsyncExitStack, ExitStack, contextmanager
 from types import TracebackType
@@ -44,7 +45,6 @@ from di.api.dependencies import DependencyParameter, DependentBase
 from di.api.executor import (
     SupportsAsyncExecutor,
     SupportsSyncExecutor,
-    SupportsTaskGraph,
 )
 from di.api.executor import Task as SupportsTask
 from di.api.providers import DependencyProvider
@@ -72,6 +72,8 @@ def bind_by_type(
     covariant: bool = False,
 ) -> BindHook:
     """Hook to substitute the matched dependency"""
+    # only classes can be matched through the MRO of the annotation
+    match_subclasses = covariant and inspect.isclass(dependency)
 
     def hook(
         param: inspect.Parameter | None, dependent: DependentBase[Any]
@@ -86,10 +88,9 @@ def bind_by_type(
         type_annotation = type_annotation_option.value
         if type_annotation == dependency:
             return provider
-        if covariant:
-            if inspect.isclass(type_annotation) and inspect.isclass(dependency):
-                if dependency in type_annotation.__mro__:
-                    return provider
+        if match_subclasses and inspect.isclass(type_annotation):
+            if dependency in type_annotation.__mro__:
+                return provider
         return None
 
     return hook
@@ -109,7 +110,7 @@ class ScopeState:
     def enter_scope(self, scope: Scope) -> FusedContextManager[ScopeState]:
         """Enter a scope and get back a new ScopeState object that you can use to execute dependencies."""
         new = ScopeState(
-            cached_values=ScopeMap(self.cached_values.copy()),
+            cached_values=ScopeMap(self.cached_values),
             stacks=self.stacks.copy(),
         )
         return ScopeContext(new, scope)
@@ -226,13 +227,19 @@ def get_params(
     path: Iterable[DependentBase[Any]],
 ) -> list[DependencyParameter]:
     """Get Dependents for parameters and resolve binds"""
-    params = dep.get_dependencies().copy()
+    params = dep.get_dependencies()
+    # most parameters don't match any bind so we only copy
+    # the list returned by get_dependencies() once we have to modify it
+    bound_params: list[DependencyParameter] | None = None
     for idx, param in enumerate(params):
         for hook in binds:
             match = hook(param.parameter, param.dependency)
             if match is not None:
                 param = param._replace(dependency=match)
-        params[idx] = param
+                if bound_params is None:
+                    bound_params = params.copy()
+        if bound_params is not None:
+            bound_params[idx] = param
         if param.parameter is not None:
             if (
                 param.dependency.call is None
@@ -248,7 +255,7 @@ def get_params(
                     ),
                     path=[*path, dep],
                 )
-    return params
+    return params if bound_params is None else bound_params
 
 
 def check_task_scope_validity(
@@ -257,13 +264,14 @@ def check_task_scope_validity(
     scopes: Mapping[Scope, int],
     path: Iterable[DependentBase[Any]],
 ) -> None:
-    if task.scope not in scopes:
+    task_scope_idx = scopes.get(task.scope)
+    if task_scope_idx is None:
         raise UnknownScopeError(
             f"Dependency{task.unwrapped_call} has an unknown scope {task.scope}."
             f"\nExample Path: {get_path_str(path)}"
         )
     for subtask in subtasks:
-        if scopes[task.scope] < scopes[subtask.scope]:
+        if task_scope_idx < scopes[subtask.scope]:
             raise ScopeViolationError(
                 f"{task.unwrapped_call} cannot depend on {subtask.unwrapped_call}"
                 f" because {subtask.unwrapped_call}'s scope ({subtask.scope})"
@@ -272,72 +280,16 @@ def check_task_scope_validity(
             )
 
 
-def build_task(  # noqa: C901
+def create_task(
     dependency: DependentBase[Any],
-    binds: Iterable[BindHook],
-    tasks: dict[CacheKey, Task],
-    task_dag: dict[Task, list[Task]],
-    dependent_dag: dict[DependentBase[Any], list[DependencyParameter]],
-    path: dict[DependentBase[Any], Any],
-    scope_idxs: Mapping[Scope, int],
-    scope_resolver: ScopeResolver | None,
+    scope: Scope,
+    cache_key: CacheKey,
+    task_id: int,
+    positional_parameters: list[Task],
+    keyword_parameters: dict[str, Task],
 ) -> Task:
     call = dependency.call
     assert call is not None
-    scope = dependency.scope
-
-    if dependency.call in {d.call for d in path}:
-        raise DependencyCycleError(
-            "Dependencies are in a cycle",
-            list(path.keys()),
-        )
-
-    params = get_params(dependency, binds, path)
-
-    positional_parameters: list[Task] = []
-    keyword_parameters: dict[str, Task] = {}
-    subtasks: list[Task] = []
-    dep_params: list[DependencyParameter] = []
-
-    path[dependency] = None  # any value will do, we only use the keys
-
-    for param in params:
-        dep_params.append(param)
-        if param.dependency.call is not None:
-            child_task = build_task(
-                param.dependency,
-                binds,
-                tasks,
-                task_dag,
-                dependent_dag,
-                path,
-                scope_idxs,
-                scope_resolver,
-            )
-            subtasks.append(child_task)
-            if param.parameter is not None:
-                if param.parameter.kind in POSITIONAL_PARAMS:
-                    positional_parameters.append(child_task)
-                else:
-                    keyword_parameters[param.parameter.name] = child_task
-        if (
-            param.dependency not in dependent_dag
-            and param.dependency.cache_key not in tasks
-        ):
-            dependent_dag[param.dependency] = []
-    if scope_resolver:
-        child_scopes = [st.scope for st in subtasks]
-        scope = scope_resolver(dependency, child_scopes, tuple(scope_idxs.keys()))
-
-    if dependency.cache_key in tasks:
-        if tasks[dependency.cache_key].scope != scope:
-            raise SolvingError(
-                f"{dependency.call} was used with multiple scopes",
-                path=list(path.keys()),
-            )
-        path.pop(dependency)
-        return tasks[dependency.cache_key]
-
     task: Task
     if is_async_gen_callable(call):
         if dependency.use_cache:
@@ -345,8 +297,8 @@ def build_task(  # noqa: C901
                 scope=scope,
                 dependent=dependency,
                 call=call,  # type: ignore[arg-type]
-                cache_key=dependency.cache_key,
-                task_id=len(tasks),
+                cache_key=cache_key,
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -355,7 +307,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                task_id=len(tasks),
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -365,8 +317,8 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                cache_key=dependency.cache_key,
-                task_id=len(tasks),
+                cache_key=cache_key,
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -375,7 +327,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                task_id=len(tasks),
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -385,8 +337,8 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                cache_key=dependency.cache_key,
-                task_id=len(tasks),
+                cache_key=cache_key,
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -395,7 +347,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                task_id=len(tasks),
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -405,8 +357,8 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,
                 dependent=dependency,
-                cache_key=dependency.cache_key,
-                task_id=len(tasks),
+                cache_key=cache_key,
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
@@ -415,23 +367,182 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,
                 dependent=dependency,
-                task_id=len(tasks),
+                task_id=task_id,
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
             )
+    return task
+
+
+def get_scope(
+    dependency: DependentBase[Any],
+    subtasks: Iterable[Task],
+    solver_scopes: Sequence[Scope],
+    scope_resolver: ScopeResolver | None,
+) -> Scope:
+    if scope_resolver:
+        child_scopes = [st.scope for st in subtasks]
+        return scope_resolver(dependency, child_scopes, solver_scopes)
+    return dependency.scope
 
-    dependent_dag[dependency] = dep_params
-    tasks[dependency.cache_key] = task
-    task_dag[task] = subtasks
-    check_task_scope_validity(
-        task,
-        subtasks,
-        scope_idxs,
-        path,
+
+class _TaskFrame:
+    """A dependency that build_task is still building subtasks for"""
+
+    __slots__ = (
+        "dependency",
+        "cache_key",
+        "params",
+        "next_param",
+        "subtasks",
+        "positional_parameters",
+        "keyword_parameters",
     )
-    # remove ourselves from the path
-    path.pop(dependency)
-    return task
+
+    def __init__(
+        self,
+        dependency: DependentBase[Any],
+        cache_key: CacheKey,
+        params: list[DependencyParameter],
+    ) -> None:
+        self.dependency = dependency
+        self.cache_key = cache_key
+        self.params = params
+        self.next_param = 0
+        self.subtasks: list[Task] = []
+        self.positional_parameters: list[Task] = []
+        self.keyword_parameters: dict[str, Task] = {}
+
+
+def build_task(  # noqa: C901
+    dependency: DependentBase[Any],
+    binds: Iterable[BindHook],
+    tasks: dict[CacheKey, Task],
+    task_dag: dict[Task, list[Task]],
+    dependent_dag: dict[DependentBase[Any], tuple[DependencyParameter, ...]],
+    scope_idxs: Mapping[Scope, int],
+    solver_scopes: Sequence[Scope],
+    scope_resolver: ScopeResolver | None,
+) -> Task:
+    """Build the Task for a dependency and, depth first, the Tasks for all of its sub-dependencies.
+
+    This walks the DAG with an explicit stack instead of recursing so that deep DAGs
+    don't hit the interpreter's recursion limit.
+    """
+    # we use a dict to represent the path so that we can have
+    # both O(1) lookups, and an ordered mutable sequence (via dict keys)
+    # we simply ignore / don't use the dict values
+    path: dict[DependentBase[Any], Any] = {}
+    # the calls of the dependencies in path, so that checking for cycles
+    # is a single set lookup instead of rebuilding a set from path for each dependency
+    # a call can only be in path once (otherwise we'd have raised a DependencyCycleError)
+    path_calls: set[DependencyProvider] = set()
+    # the frames on the stack are always the same dependencies as the ones in path
+    stack: list[_TaskFrame] = []
+    to_enter: DependentBase[Any] | None = dependency
+    built: Task | None = None
+
+    while True:
+        if to_enter is not None:
+            if to_enter.call in path_calls:
+                raise DependencyCycleError(
+                    "Dependencies are in a cycle",
+                    list(path.keys()),
+                )
+            # cache_key is a property that may build and hash a new key on every access
+            cache_key = to_enter.cache_key
+            existing_task = tasks.get(cache_key)
+            if existing_task is None:
+                params = get_params(to_enter, binds, path)
+                path[to_enter] = None  # any value will do, we only use the keys
+                path_calls.add(to_enter.call)  # type: ignore[arg-type]
+                stack.append(_TaskFrame(to_enter, cache_key, params))
+            else:
+                # we already built this task and all of its subtasks
+                # (maybe from a different dependent with the same cache key)
+                # so there's no need to walk that part of the DAG again
+                # we just need to check that it's being used with the same scope
+                scope = get_scope(
+                    to_enter, task_dag[existing_task], solver_scopes, scope_resolver
+                )
+                if existing_task.scope != scope:
+                    raise SolvingError(
+                        f"{to_enter.call} was used with multiple scopes",
+                        path=[*path, to_enter],
+                    )
+                built = existing_task
+            to_enter = None
+
+        frame = stack[-1]
+        params = frame.params
+
+        if built is not None:
+            # the subtask for the last param we visited just finished building
+            parameter = params[frame.next_param - 1].parameter
+            frame.subtasks.append(built)
+            if parameter is not None:
+                if parameter.kind in POSITIONAL_PARAMS:
+                    frame.positional_parameters.append(built)
+                else:
+                    frame.keyword_parameters[parameter.name] = built
+            built = None
+
+        while frame.next_param < len(params):
+            sub_dependency = params[frame.next_param].dependency
+            frame.next_param += 1
+            if sub_dependency.call is not None:
+                to_enter = sub_dependency
+                break
+            # dependencies without a call don't get a task (and so are never entered)
+            # but we still include them in the DAG so that they can be introspected
+            if (
+                sub_dependency not in dependent_dag
+                and sub_dependency.cache_key not in tasks
+            ):
+                dependent_dag[sub_dependency] = ()
+        if to_enter is not None:
+            continue
+
+        # all subtasks are built, now we can build this task
+        current = frame.dependency
+        cache_key = frame.cache_key
+        scope = get_scope(current, frame.subtasks, solver_scopes, scope_resolver)
+
+        existing_task = tasks.get(cache_key)
+        if existing_task is not None:
+            if existing_task.scope != scope:
+                raise SolvingError(
+                    f"{current.call} was used with multiple scopes",
+                    path=list(path.keys()),
+                )
+            task = existing_task
+        else:
+            task = create_task(
+                current,
+                scope=scope,
+                cache_key=cache_key,
+                task_id=len(tasks),
+                positional_parameters=frame.positional_parameters,
+                keyword_parameters=frame.keyword_parameters,
+            )
+            # the DAG is read-only once solved, so store an immutable snapshot of the params
+            dependent_dag[current] = tuple(params)
+            tasks[cache_key] = task
+            task_dag[task] = frame.subtasks
+            check_task_scope_validity(
+                task,
+                frame.subtasks,
+                scope_idxs,
+                path,
+            )
+
+        # remove ourselves from the path
+        path.pop(current)
+        path_calls.remove(current.call)  # type: ignore[arg-type]
+        stack.pop()
+        if not stack:
+            return task
+        built = task
 
 
 def solve(
@@ -444,6 +555,11 @@ def solve(
 
     Returns a SolvedDependent that can be executed to get the dependency's value.
     """
+    # binds are iterated for every parameter of every dependency
+    # so take a snapshot once: iterating a tuple is cheap, it can be iterated
+    # more than once even if we were given an iterator and it can't change mid-solve
+    binds = tuple(binds)
+
     # If the dependency itself is a bind, replace it
     for hook in binds:
         match = hook(None, dependency)
@@ -454,29 +570,26 @@ def solve(
         raise ValueError("DependentBase.call must not be None")
 
     task_dag: dict[Task, list[Task]] = {}
-    dep_dag: dict[DependentBase[Any], list[DependencyParameter]] = {}
+    dep_dag: dict[DependentBase[Any], tuple[DependencyParameter, ...]] = {}
     scope_idxs = {scope: idx for idx, scope in enumerate(scopes)}
 
-    # this is implemented recursively
-    # which will crash on DAGs with depth > 1000 (default recursion limit)
-    # if we encounter that in a real world use case
-    # we can just rewrite this to be iterative
     root_task = build_task(
         dependency=dependency,
         binds=binds,
         tasks={},
         task_dag=task_dag,
         dependent_dag=dep_dag,
-        # we use a dict to represent the path so that we can have
-        # both O(1) lookups, and an ordered mutable sequence (via dict keys)
-        # we simply ignore / don't use the dict values
-        path={},
         scope_idxs=scope_idxs,
+        # built once here instead of once per dependency that needs a scope resolved
+        solver_scopes=tuple(scope_idxs),
         scope_resolver=scope_resolver,
     )
 
     ts = TopologicalSorter(task_dag)
-    static_order = tuple(ts.copy().static_order())
+    # build_task registers each task only after all of its subtasks
+    # so the insertion order of task_dag is already a valid topological order
+    # and we don't need to walk a copy of the sorter to get a static order
+    static_order = tuple(task_dag)
     ts.prepare()
     assert dependency.call is not None
     solved = SolvedDependent(
@@ -501,6 +614,18 @@ class SolvedDependent(Generic[DependencyType]):
     A SolvedDependent could be a user's endpoint/controller function.
     """
 
+    __slots__ = (
+        "dependency",
+        "dag",
+        "container_cache",
+        "_root_task",
+        "_topological_sorter",
+        "_static_order",
+        "_empty_results",
+        # frameworks may keep solved dependents in weak mappings
+        "__weakref__",
+    )
+
     dependency: DependentBase[DependencyType]
     dag: Mapping[DependentBase[Any], Iterable[DependencyParameter]]
     # container_cache can be used by the creating container to store data that is tied
@@ -525,28 +650,20 @@ class SolvedDependent(Generic[DependencyType]):
 
     def _prepare_execution(
         self,
-        stacks: Mapping[Scope, AsyncExitStack | ExitStack],
-        cache: ScopeMap[CacheKey, Any],
-        values: Mapping[DependencyProvider, Any] | None = None,
-    ) -> tuple[list[Any], SupportsTaskGraph, ExecutionState, Task,]:
+        state: ScopeState,
+        values: Mapping[DependencyProvider, Any] | None,
+    ) -> tuple[list[Any], ExecutionState, TaskGraph]:
         results = self._empty_results.copy()
-        if values is None:
-            values = EMPTY_VALUES
         execution_state = ExecutionState(
-            values=values,
-            stacks=stacks,
-            results=results,
-            cache=cache,
-        )
-        ts = TaskGraph(
-            self._topological_sorter,
-            self._static_order,
+            state.stacks,
+            results,
+            state.cached_values,
+            EMPTY_VALUES if values is None else values,
         )
         return (
             results,
-            ts,
             execution_state,
-            self._root_task,
+            TaskGraph(self._topological_sorter, self._static_order),
         )
 
     def execute_sync(
@@ -560,13 +677,9 @@ class SolvedDependent(Generic[DependencyType]):
         This method is synchronous and uses a synchronous executor,
         but the executor may still be able to execute async dependencies.
         """
-        results, ts, execution_state, root_task = self._prepare_execution(
-            stacks=state.stacks,
-            cache=state.cached_values,
-            values=values,
-        )
+        results, execution_state, ts = self._prepare_execution(state, values)
         executor.execute_sync(ts, execution_state)
-        return results[root_task.task_id]  # type: ignore[no-any-return]
+        return results[self._root_task.task_id]  # type: ignore[no-any-return]
 
     async def execute_async(
         self,
@@ -575,31 +688,36 @@ class SolvedDependent(Generic[DependencyType]):
         values: Mapping[DependencyProvider, Any] | None = None,
     ) -> DependencyType:
         """Execute an already solved dependency."""
-        results, ts, execution_state, root_task = self._prepare_execution(
-            stacks=state.stacks,
-            cache=state.cached_values,
-            values=values,
-        )
+        results, execution_state, ts = self._prepare_execution(state, values)
         await executor.execute_async(ts, execution_state)
-        return results[root_task.task_id]  # type: ignore[no-any-return]
+        return results[self._root_task.task_id]  # type: ignore[no-any-return]
+
+
+# bound the number of remembered solves so that code that solves a new Dependent
+# for every call (e.g. `container.solve(Dependent(lambda: ...))`) doesn't leak memory
+_SOLVE_CACHE_SIZE = 1024
 
 
 class Container:
     """Solve and execute dependencies.
 
     Generally you will want one Container per application.
-    There is not performance advantage to re-using a container, the only reason to do so is to share binds.
+    Re-using a container shares binds and lets it re-use the results of previous calls to `Container.solve()`.
     For each "thing" you want to wire with di and execute you'll want to call `Container.solve()`
     exactly once and then keep a reference to the returned `SolvedDependent` to pass to `Container.execute`.
     Solving is very expensive so avoid doing it in a hot loop.
     """
 
-    __slots__ = ("_bind_hooks",)
+    __slots__ = ("_bind_hooks", "_solve_cache", "_solve_cache_lock")
 
     _bind_hooks: list[BindHook]
+    _solve_cache: dict[typing.Hashable, tuple[DependentBase[Any], SolvedDependent[Any]]]
+    _solve_cache_lock: threading.Lock
 
     def __init__(self) -> None:
         self._bind_hooks = []
+        self._solve_cache = {}
+        self._solve_cache_lock = threading.Lock()
 
     def bind(
         self,
@@ -612,6 +730,8 @@ class Container:
         """
 
         self._bind_hooks.append(hook)
+        # anything we solved before was solved against the old set of binds
+        self.clear_solve_cache()
 
         @contextmanager
         def unbind() -> Generator[None, None, None]:
@@ -619,22 +739,66 @@ class Container:
                 yield
             finally:
                 self._bind_hooks.remove(hook)
+                self.clear_solve_cache()
 
         return unbind()
 
+    def clear_solve_cache(self) -> None:
+        """Forget all previously solved dependencies.
+
+        This happens automatically when a bind is added or removed.
+        You only need to call it if the result of solving can change in some other way,
+        for example if a bind hook depends on mutable state.
+        """
+        with self._solve_cache_lock:
+            self._solve_cache.clear()
+
     def solve(
         self,
         dependency: DependentBase[DependencyType],
         scopes: Sequence[Scope],
         scope_resolver: ScopeResolver | None = None,
+        *,
+        use_cache: bool = True,
     ) -> SolvedDependent[DependencyType]:
         """Build the dependency graph.
 
         Should happen once, maybe during startup.
 
-        Solving dependencies can be slow.
+        Solving dependencies can be slow, so by default the result is remembered:
+        solving the same dependency object with the same scopes and scope resolver
+        returns the previously solved dependency until a bind is added or removed
+        or `Container.clear_solve_cache()` is called.
+        The remembered graph is a snapshot, so changes made to the dependency object
+        after solving it (e.g. to its scope) and bind hooks that depend on other mutable state
+        are not picked up.
+        Up to 1024 solved dependencies are kept alive per container.
+        Pass `use_cache=False` to always solve from scratch.
         """
-        return solve(dependency, scopes, self._bind_hooks, scope_resolver)
+        scopes = tuple(scopes)
+        if not use_cache:
+            return solve(dependency, scopes, self._bind_hooks, scope_resolver)
+        # dependents may define equality however they want (e.g. by call)
+        # so we key on the object itself and keep it in the value,
+        # which also keeps its id from being reused while it is cached
+        key = (id(dependency), scopes, scope_resolver)
+        try:
+            with self._solve_cache_lock:
+                cached = self._solve_cache.pop(key, None)
+                if cached is not None:
+                    # re-insert so that dict order tracks recency
+                    self._solve_cache[key] = cached
+                    return cached[1]
+        except TypeError:  # unhashable scopes or scope resolver
+            return solve(dependency, scopes, self._bind_hooks, scope_resolver)
+        # solve outside of the lock so that slow solves don't block other threads
+        solved = solve(dependency, scopes, self._bind_hooks, scope_resolver)
+        with self._solve_cache_lock:
+            while len(self._solve_cache) >= _SOLVE_CACHE_SIZE:
+                # dicts keep insertion order so the first key is the least recently used
+                del self._solve_cache[next(iter(self._solve_cache))]
+            self._solve_cache[key] = (dependency, solved)
+        return solved
 
     def enter_scope(
         self, scope: Scope, state: ScopeState | None = None
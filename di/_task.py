@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 from contextlib import AsyncExitStack, ExitStack
 from typing import (
     Any,
@@ -70,10 +71,22 @@ def generate_call_with_deps_from_results(
         args.append(positional_arg_template.format(task.task_id))
     for keyword, task in keyword_parameters.items():
         args.append(keyword_arg_template.format(keyword, task.task_id))
+    return _compile_call_with_deps_from_results(",".join(args))(call)
+
+
+# many tasks share the same argument layout (e.g. every dependency without parameters)
+# so we compile each layout once and bind it to the call in a closure
+@functools.lru_cache(maxsize=1024)
+def _compile_call_with_deps_from_results(
+    args: str,
+) -> Callable[[_ExecutableCallable], Callable[[list[Any]], Any]]:
     locals: dict[str, Any] = {}
-    globals = {"call": call}
-    exec(f'def execute(results): return call({",".join(args)})', globals, locals)
-    return locals["execute"]  # type: ignore[no-any-return]
+    exec(
+        f"def bind(call):\n    def execute(results): return call({args})\n    return execute",
+        {},
+        locals,
+    )
+    return locals["bind"]  # type: ignore[no-any-return]
 
 
 ProviderType = TypeVar(
@@ -189,6 +202,8 @@ class _TransformAsyncCM:
 
 
 class NotCachedSyncTask(_TaskBase[CallableProvider[Any]], SyncTask):
+    __slots__ = ()
+
     def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -198,6 +213,8 @@ class NotCachedSyncTask(_TaskBase[CallableProvider[Any]], SyncTask):
 
 
 class CachedSyncTask(_CachedTaskBase[CallableProvider[Any]], SyncTask):
+    __slots__ = ()
+
     def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -214,6 +231,8 @@ class CachedSyncTask(_CachedTaskBase[CallableProvider[Any]], SyncTask):
 class NotCachedSyncContextManagerTask(
     _TransformSyncCM, _TaskBase[GeneratorProvider[Any]], SyncTask
 ):
+    __slots__ = ()
+
     def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -227,6 +246,8 @@ class NotCachedSyncContextManagerTask(
 class CachedSyncContextManagerTask(
     _TransformSyncCM, _CachedTaskBase[GeneratorProvider[Any]], SyncTask
 ):
+    __slots__ = ()
+
     def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -243,6 +264,8 @@ class CachedSyncContextManagerTask(
 
 
 class NotCachedAsyncTask(_TaskBase[CoroutineProvider[Any]], AsyncTask):
+    __slots__ = ()
+
     async def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -252,6 +275,8 @@ class NotCachedAsyncTask(_TaskBase[CoroutineProvider[Any]], AsyncTask):
 
 
 class CachedAsyncTask(_CachedTaskBase[CoroutineProvider[Any]], AsyncTask):
+    __slots__ = ()
+
     async def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -268,6 +293,8 @@ class CachedAsyncTask(_CachedTaskBase[CoroutineProvider[Any]], AsyncTask):
 class NotCachedAsyncContextManagerTask(
     _TransformAsyncCM, _TaskBase[AsyncGeneratorProvider[Any]], AsyncTask
 ):
+    __slots__ = ()
+
     async def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -287,6 +314,8 @@ class NotCachedAsyncContextManagerTask(
 class CachedAsyncContextManagerTask(
     _TransformAsyncCM, _CachedTaskBase[AsyncGeneratorProvider[Any]], AsyncTask
 ):
+    __slots__ = ()
+
     async def compute(self, state: ExecutionState) -> None:
         if self.unwrapped_call in state._values:
             state._results[self.task_id] = state._values[self.unwrapped_call]
@@ -27,6 +27,14 @@ def unwrap_callable(call: Any) -> Any:
     return call
 
 
+# Classifying a callable unwraps it and inspects it and its __call__,
+# which is relatively expensive and is done for every dependency in every solve.
+# The result only depends on the callable itself, so we memoize it
+# (bounded so that we don't keep dynamically created callables alive forever).
+_CALLABLE_KIND_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_CALLABLE_KIND_CACHE_SIZE)
 def is_coroutine_callable(call: Any) -> bool:
     if inspect.isclass(call):
         return False
@@ -37,6 +45,7 @@ def is_coroutine_callable(call: Any) -> bool:
     return inspect.iscoroutinefunction(dunder_call)
 
 
+@functools.lru_cache(maxsize=_CALLABLE_KIND_CACHE_SIZE)
 def is_async_gen_callable(call: Callable[..., Any]) -> bool:
     unwrapped_call = unwrap_callable(call)
     if inspect.isasyncgenfunction(unwrapped_call):
@@ -45,6 +54,7 @@ def is_async_gen_callable(call: Callable[..., Any]) -> bool:
     return inspect.isasyncgenfunction(dunder_call)
 
 
+@functools.lru_cache(maxsize=_CALLABLE_KIND_CACHE_SIZE)
 def is_gen_callable(call: Any) -> bool:
     unwrapped_call = unwrap_callable(call)
     if inspect.isgeneratorfunction(unwrapped_call):
@@ -84,6 +94,15 @@ def fix_annotated_optional_type_hints(hints: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def get_parameters(call: Callable[..., Any]) -> Dict[str, inspect.Parameter]:
+    try:
+        hash(call)
+    except TypeError:
+        return _get_parameters(call)
+    # the cached dict is shared so hand out a copy that callers are free to modify
+    return dict(_get_parameters_cached(call))
+
+
+def _get_parameters(call: Callable[..., Any]) -> Dict[str, inspect.Parameter]:
     params: Mapping[str, inspect.Parameter]
     if inspect.isclass(call) and (call.__new__ is not object.__new__):  # type: ignore[comparison-overlap]
         # classes overriding __new__, including some generic metaclasses, result in __new__ getting read
@@ -101,6 +120,13 @@ def get_parameters(call: Callable[..., Any]) -> Dict[str, inspect.Parameter]:
     return processed_params
 
 
+# signature inspection and type hint evaluation are the most expensive part of solving
+# and, like the checks above, only depend on the callable
+_get_parameters_cached = functools.lru_cache(maxsize=_CALLABLE_KIND_CACHE_SIZE)(
+    _get_parameters
+)
+
+
 def get_type(param: inspect.Parameter) -> Optional[Some[Any]]:
     annotation = param.annotation
     if annotation is param.empty:
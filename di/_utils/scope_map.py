@@ -17,6 +17,9 @@ class ScopeMap(Dict[Scope, Dict[KT, VT]]):
     no iteration is required: we can simply pop all keys in that scope.
     """
 
+    # a new ScopeMap is created every time a scope is entered
+    __slots__ = ()
+
     def get_key(self, key: KT, *, scope: Scope, default: T) -> Union[VT, T]:
         for current_scope, scopemap in self.items():
             if key in scopemap:
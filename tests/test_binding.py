@@ -4,6 +4,7 @@ from typing import List, Protocol, TypeVar
 import pytest
 
 from di import Container, bind_by_type
+from di.api.dependencies import DependencyParameter
 from di.dependent import Dependent, Marker
 from di.executors import SyncExecutor
 from di.typing import Annotated
@@ -211,3 +212,31 @@ def test_bind_covariant() -> None:
         instance = solved.execute_sync(executor=SyncExecutor(), state=state)
 
     assert isinstance(instance, Dog)
+
+
+def test_bind_does_not_modify_dependencies_of_dependent() -> None:
+    """Binds are applied to a copy of the parameters returned by get_dependencies()"""
+
+    class Test:
+        def __init__(self, v: int = 1) -> None:
+            self.v = v
+
+    def uses_test(t: Test) -> int:
+        return t.v
+
+    class ListDependent(Dependent[int]):
+        def __init__(self) -> None:
+            super().__init__(uses_test)
+            self.params = super().get_dependencies()
+
+        def get_dependencies(self) -> List[DependencyParameter]:
+            return self.params
+
+    container = Container()
+    dependent = ListDependent()
+    original = list(dependent.params)
+    with container.bind(bind_by_type(Dependent(lambda: Test(2)), Test)):
+        solved = container.solve(dependent, scopes=[None])
+        with container.enter_scope(None) as state:
+            assert solved.execute_sync(executor=SyncExecutor(), state=state) == 2
+    assert dependent.params == original
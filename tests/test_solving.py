@@ -1,9 +1,13 @@
+import sys
+import threading
+import weakref
 from random import random
 from typing import Any, List, Mapping
 
 import pytest
 
 from di import Container, bind_by_type
+from di._container import _SOLVE_CACHE_SIZE
 from di.api.dependencies import DependencyParameter
 from di.api.providers import DependencyProvider
 from di.dependent import Dependent, JoinedDependent, Marker
@@ -332,3 +336,168 @@ def test_solved_dag(
     got = {d.call: [s.dependency.call for s in dag[d]] for d in dag}
 
     assert got == expected
+
+
+def test_solve_is_cached_until_binds_change() -> None:
+    class Foo:
+        pass
+
+    class Bar(Foo):
+        pass
+
+    container = Container()
+    dep = Dependent(Foo)
+
+    solved = container.solve(dep, scopes=[None])
+    assert container.solve(dep, scopes=[None]) is solved
+    # different scopes or a different dependent object are solved separately
+    assert container.solve(dep, scopes=["app", None]) is not solved
+    assert container.solve(Dependent(Foo), scopes=[None]) is not solved
+
+    with container.bind(bind_by_type(Dependent(Bar), Foo)):
+        rebound = container.solve(dep, scopes=[None])
+        assert rebound is not solved
+        with container.enter_scope(None) as state:
+            res = rebound.execute_sync(executor=SyncExecutor(), state=state)
+        assert isinstance(res, Bar)
+
+    unbound = container.solve(dep, scopes=[None])
+    assert unbound is not rebound
+    with container.enter_scope(None) as state:
+        res = unbound.execute_sync(executor=SyncExecutor(), state=state)
+    assert type(res) is Foo
+
+    container.clear_solve_cache()
+    assert container.solve(dep, scopes=[None]) is not unbound
+
+    # changes to the dependent after solving are only picked up without the cache
+    stale = container.solve(dep, scopes=[None])
+    dep.scope = "app"
+    assert container.solve(dep, scopes=[None]) is stale
+    with pytest.raises(UnknownScopeError):
+        container.solve(dep, scopes=[None], use_cache=False)
+
+
+def test_solved_dependent_is_weakrefable() -> None:
+    container = Container()
+    solved = container.solve(Dependent(lambda: None), scopes=[None])
+    assert weakref.ref(solved)() is solved
+
+
+def test_solve_cache_is_keyed_by_dependent_identity() -> None:
+    """Dependents that compare equal are still solved separately"""
+
+    class ByCall(Dependent[None]):
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, ByCall) and self.call is other.call
+
+        def __hash__(self) -> int:
+            return hash(self.call)
+
+    def f() -> None:
+        ...
+
+    container = Container()
+    app_scoped = container.solve(ByCall(f, scope="app"), scopes=["app", None])
+    none_scoped = container.solve(ByCall(f, scope=None), scopes=["app", None])
+    assert none_scoped is not app_scoped
+    assert none_scoped.dependency.scope is None
+
+
+def test_solve_cache_evicts_least_recently_used() -> None:
+    container = Container()
+    first = Dependent(lambda: None)
+    solved = container.solve(first, scopes=[None])
+    throwaway = Dependent(lambda: None)
+    throwaway_solved = container.solve(throwaway, scopes=[None])
+    for _ in range(_SOLVE_CACHE_SIZE * 2):
+        # keep using the first dependent while solving many others
+        assert container.solve(first, scopes=[None]) is solved
+        container.solve(Dependent(lambda: None), scopes=[None])
+    assert container.solve(first, scopes=[None]) is solved
+    assert container.solve(throwaway, scopes=[None]) is not throwaway_solved
+
+
+def test_solve_cache_is_thread_safe(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("di._container._SOLVE_CACHE_SIZE", 4)
+    # switch threads as often as possible to provoke races
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    container = Container()
+    errors: List[BaseException] = []
+
+    def solve_many() -> None:
+        try:
+            for _ in range(1000):
+                container.solve(Dependent(lambda: None), scopes=[None])
+        except BaseException as e:  # pragma: no cover, only on failure
+            errors.append(e)
+
+    threads = [threading.Thread(target=solve_many) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert errors == []
+    assert len(container._solve_cache) <= 4
+
+
+def test_solve_dag_deeper_than_recursion_limit() -> None:
+    depth = sys.getrecursionlimit() + 100
+    calls: List[int] = []
+
+    class ChainDependent(Dependent[None]):
+        def __init__(self, n: int) -> None:
+            super().__init__(lambda: calls.append(n))
+            self.n = n
+
+        def get_dependencies(self) -> List[DependencyParameter]:
+            if self.n == 0:
+                return []
+            return [DependencyParameter(ChainDependent(self.n - 1), None)]
+
+    container = Container()
+    solved = container.solve(ChainDependent(depth - 1), scopes=[None])
+    with container.enter_scope(None) as state:
+        solved.execute_sync(executor=SyncExecutor(), state=state)
+    assert calls == list(range(depth))
+
+
+def test_shared_sub_dependencies_are_only_walked_once() -> None:
+    def leaf() -> None:
+        ...
+
+    def left() -> None:
+        ...
+
+    def right() -> None:
+        ...
+
+    def root() -> None:
+        ...
+
+    graph: Mapping[Any, List[Any]] = {
+        root: [left, right],
+        left: [leaf],
+        right: [leaf],
+        leaf: [],
+    }
+    get_dependencies_calls: List[Any] = []
+
+    class GraphDependent(Dependent[None]):
+        def get_dependencies(self) -> List[DependencyParameter]:
+            get_dependencies_calls.append(self.call)
+            # new dependents each time, like Markers produce
+            return [
+                DependencyParameter(GraphDependent(call), None)
+                for call in graph[self.call]
+            ]
+
+    container = Container()
+    solved = container.solve(GraphDependent(root), scopes=[None])
+    assert sorted(get_dependencies_calls, key=id) == sorted(graph, key=id)
+    with container.enter_scope(None) as state:
+        solved.execute_sync(executor=SyncExecutor(), state=state)
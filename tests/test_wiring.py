@@ -3,7 +3,7 @@ from typing import Optional
 from di import Container, bind_by_type
 from di.dependent import Dependent, Marker
 from di.executors import SyncExecutor
-from di.typing import Annotated
+from di.typing import Annotated, get_parameters
 
 
 def test_wiring_from_annotation() -> None:
@@ -92,3 +92,13 @@ def test_autowiring_class_with_default_class_from_bind() -> None:
         injected_value = solved.execute_sync(SyncExecutor(), state=state)
 
     assert injected_value == "bound"
+
+
+def test_get_parameters_returns_a_copy() -> None:
+    def func(a: int, b: str) -> None:
+        ...
+
+    params = get_parameters(func)
+    assert list(params) == ["a", "b"]
+    params.pop("a")
+    assert list(get_parameters(func)) == ["a", "b"]